@@ -0,0 +1,105 @@
+import httpx
+import pytest
+from notion_client.errors import APIResponseError
+
+from unstructured_ingest.connector.notion import client as notion_client
+from unstructured_ingest.connector.notion.client import (
+    MAX_RATE_LIMITED_RETRIES,
+    Client,
+    RateLimiter,
+)
+
+RATE_LIMITED_BODY = {
+    "object": "error",
+    "status": 429,
+    "code": "rate_limited",
+    "message": "rate limited",
+}
+
+
+def get_client(responses: list) -> Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    return Client(auth="token", client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(notion_client.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(notion_client.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_rate_limiter_without_rate_never_waits(clock: FakeClock):
+    rate_limiter = RateLimiter()
+    for _ in range(100):
+        rate_limiter.wait()
+    assert clock.sleeps == []
+
+
+def test_rate_limiter_allows_bursts(clock: FakeClock):
+    rate_limiter = RateLimiter(requests_per_second=2, burst=3)
+    for _ in range(3):
+        rate_limiter.wait()
+    assert clock.sleeps == []
+
+    rate_limiter.wait()
+    assert clock.sleeps == [0.5]
+
+    # Tokens refill while idle, up to the burst size
+    clock.now += 10
+    for _ in range(3):
+        rate_limiter.wait()
+    assert clock.sleeps == [0.5]
+
+
+def test_rate_limiter_pause(clock: FakeClock):
+    rate_limiter = RateLimiter()
+    rate_limiter.pause(2)
+    rate_limiter.wait()
+    assert clock.sleeps == [2]
+
+
+def test_request_retries_rate_limited_responses():
+    client = get_client(
+        [
+            httpx.Response(429, headers={"retry-after": "0"}, json=RATE_LIMITED_BODY),
+            httpx.Response(200, json={"object": "list", "results": []}),
+        ],
+    )
+    assert client.request(path="users", method="GET") == {"object": "list", "results": []}
+
+
+def test_request_gives_up_after_max_retries():
+    # Newer notion-client versions also retry internally, enough responses are queued for both
+    client = get_client(
+        [
+            httpx.Response(429, headers={"retry-after": "0"}, json=RATE_LIMITED_BODY)
+            for _ in range(100 * (MAX_RATE_LIMITED_RETRIES + 1))
+        ],
+    )
+    with pytest.raises(APIResponseError):
+        client.request(path="users", method="GET")
+
+
+def test_send_retries_rate_limited_responses():
+    client = get_client(
+        [httpx.Response(429, headers={"retry-after": "0"}), httpx.Response(200)],
+    )
+    request = client._build_request("HEAD", "pages/id")
+    assert client.send(request).status_code == 200
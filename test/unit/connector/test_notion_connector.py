@@ -0,0 +1,24 @@
+import pytest
+
+from unstructured_ingest.connector.notion.connector import normalize_id
+
+CANONICAL_ID = "0a1b2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d"
+
+
+@pytest.mark.parametrize(
+    "notion_id",
+    [
+        CANONICAL_ID,
+        CANONICAL_ID.upper(),
+        CANONICAL_ID.replace("-", ""),
+        f"  {CANONICAL_ID}\n",
+    ],
+)
+def test_normalize_id(notion_id: str):
+    assert normalize_id(notion_id) == CANONICAL_ID
+
+
+@pytest.mark.parametrize("notion_id", ["", "not-an-id", CANONICAL_ID[:-1]])
+def test_normalize_id_invalid(notion_id: str):
+    with pytest.raises(ValueError):
+        normalize_id(notion_id)
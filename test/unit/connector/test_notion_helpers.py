@@ -0,0 +1,336 @@
+import copy
+import logging
+import uuid
+from collections import Counter
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Set
+
+import pytest
+from notion_client.errors import APIResponseError
+
+from unstructured_ingest.connector.notion.helpers import (
+    extract_page_html,
+    get_recursive_content_from_roots,
+    get_uuid_from_url,
+    is_valid_uuid,
+)
+from unstructured_ingest.connector.notion.types.block import Block
+from unstructured_ingest.connector.notion.types.page import Page
+
+logger = logging.getLogger(__name__)
+
+
+class FakeClient:
+    """Serves blocks from in memory data through the same calls the helpers make on the
+    api client, counting how many times the children of each block are listed."""
+
+    def __init__(self):
+        self.blocks_by_id: Dict[str, dict] = {}
+        self.children: Dict[str, List[dict]] = {}
+        self.database_rows: Dict[str, List[dict]] = {}
+        self.failing_ids: Set[str] = set()
+        self.children_calls: Counter = Counter()
+        self.blocks = SimpleNamespace(
+            retrieve=self.retrieve_block,
+            children=SimpleNamespace(iterate_list=self.iterate_children),
+        )
+        self.databases = SimpleNamespace(iterate_query=self.iterate_query)
+
+    def add_block(
+        self,
+        block_type: str,
+        data: dict,
+        parent_id: Optional[str] = None,
+        has_children: bool = False,
+        block_id: Optional[str] = None,
+    ) -> str:
+        block_id = block_id or str(uuid.uuid4())
+        self.blocks_by_id[block_id] = {
+            "object": "block",
+            "id": block_id,
+            "type": block_type,
+            "created_time": "2024-01-01T00:00:00.000Z",
+            "created_by": {"object": "user", "id": "user"},
+            "last_edited_time": "2024-01-01T00:00:00.000Z",
+            "last_edited_by": {"object": "user", "id": "user"},
+            "archived": False,
+            "in_trash": False,
+            "has_children": has_children,
+            "parent": {"type": "page_id", "page_id": parent_id or "workspace"},
+            block_type: data,
+        }
+        if parent_id:
+            self.children.setdefault(parent_id, []).append(self.blocks_by_id[block_id])
+        return block_id
+
+    def add_page(self, title: str, parent_id: Optional[str] = None) -> str:
+        return self.add_block(
+            "child_page",
+            {"title": title},
+            parent_id=parent_id,
+            has_children=True,
+        )
+
+    def add_database_row(self, database_id: str) -> str:
+        page_id = str(uuid.uuid4())
+        self.database_rows.setdefault(database_id, []).append(
+            {
+                "object": "page",
+                "id": page_id,
+                "created_time": "2024-01-01T00:00:00.000Z",
+                "created_by": {"object": "user", "id": "user"},
+                "last_edited_time": "2024-01-01T00:00:00.000Z",
+                "last_edited_by": {"object": "user", "id": "user"},
+                "archived": False,
+                "in_trash": False,
+                "properties": {},
+                "parent": {"type": "database_id", "database_id": database_id},
+                "url": "https://www.notion.so/row",
+                "public_url": None,
+                "icon": None,
+                "cover": None,
+            },
+        )
+        return page_id
+
+    def retrieve_block(self, block_id: str) -> Block:
+        return Block.from_dict(copy.deepcopy(self.blocks_by_id[block_id]))
+
+    def iterate_children(self, block_id: str):
+        self.children_calls[block_id] += 1
+        if block_id in self.failing_ids:
+            raise api_error()
+        yield [Block.from_dict(copy.deepcopy(b)) for b in self.children.get(block_id, [])]
+
+    def iterate_query(self, database_id: str):
+        yield [Page.from_dict(copy.deepcopy(p)) for p in self.database_rows.get(database_id, [])]
+
+
+def api_error() -> APIResponseError:
+    # The constructor differs between notion-client versions, only the type matters here
+    error = APIResponseError.__new__(APIResponseError)
+    Exception.__init__(error, "object not found")
+    return error
+
+
+def rich_text(text: str) -> dict:
+    return {
+        "type": "text",
+        "text": {"content": text, "link": None},
+        "annotations": {
+            "bold": False,
+            "italic": False,
+            "strikethrough": False,
+            "underline": False,
+            "code": False,
+            "color": "default",
+        },
+        "plain_text": text,
+        "href": None,
+    }
+
+
+def text_block(text: str) -> dict:
+    return {"color": "default", "rich_text": [rich_text(text)]}
+
+
+def get_body(client: FakeClient, page_id: str) -> str:
+    html = extract_page_html(client=client, page_id=page_id, logger=logger).html.render()
+    return html.split("<body>", 1)[1].rsplit("</body>", 1)[0]
+
+
+@pytest.fixture
+def client() -> FakeClient:
+    return FakeClient()
+
+
+def test_extract_page_html_empty_column_list(client: FakeClient):
+    page_id = client.add_page("page")
+    client.add_block("column_list", {}, parent_id=page_id, has_children=True)
+
+    html = extract_page_html(client=client, page_id=page_id, logger=logger).html.render()
+
+    assert html == (
+        "<html><head><title>page</title></head><body><p>page<div></div></p></body></html>"
+    )
+
+
+def test_extract_page_html_untitled_page(client: FakeClient):
+    page_id = client.add_page("")
+    client.add_block("paragraph", text_block("hello"), parent_id=page_id)
+
+    assert get_body(client, page_id) == "<p><div>hello</div></p>"
+
+
+def test_extract_page_html_joins_list_items(client: FakeClient):
+    page_id = client.add_page("page")
+    parent_item = client.add_block(
+        "bulleted_list_item",
+        text_block("b1"),
+        parent_id=page_id,
+        has_children=True,
+    )
+    client.add_block("bulleted_list_item", text_block("b1a"), parent_id=parent_item)
+    client.add_block("bulleted_list_item", text_block("b2"), parent_id=page_id)
+    client.add_block("numbered_list_item", text_block("n1"), parent_id=page_id)
+    client.add_block("numbered_list_item", text_block("n2"), parent_id=page_id)
+    client.add_block("paragraph", text_block("end"), parent_id=page_id)
+
+    # Consecutive items are joined into a single list, which is placed after the other blocks
+    assert get_body(client, page_id) == (
+        "<p>page"
+        "<ol type='a'>"
+        "<li style='margin-left: 10px'>n1</li><li style='margin-left: 10px'>n2</li>"
+        "</ol>"
+        "<div>end</div>"
+        "<ul type='square'>"
+        "<li style='margin-left: 10px'>b1"
+        "<ul type='disc'><li style='margin-left: 10px'>b1a</li></ul>"
+        "</li>"
+        "<li style='margin-left: 10px'>b2</li>"
+        "</ul>"
+        "</p>"
+    )
+
+
+def test_extract_page_html_column_list(client: FakeClient):
+    page_id = client.add_page("page")
+    column_list = client.add_block("column_list", {}, parent_id=page_id, has_children=True)
+    for text in ["left", "right"]:
+        column = client.add_block("column", {}, parent_id=column_list, has_children=True)
+        client.add_block("paragraph", text_block(text), parent_id=column)
+
+    assert get_body(client, page_id) == (
+        "<p>page<div>"
+        "<div style='width:50.0%; float: left'><div><div>left</div></div></div>"
+        "<div style='width:50.0%; float: left'><div><div>right</div></div></div>"
+        "</div></p>"
+    )
+
+
+def test_extract_page_html_table(client: FakeClient):
+    page_id = client.add_page("page")
+    table = client.add_block(
+        "table",
+        {"table_width": 2, "has_column_header": True, "has_row_header": False},
+        parent_id=page_id,
+        has_children=True,
+    )
+    client.add_block("table_row", {"cells": [[rich_text("h1")], [rich_text("h2")]]}, table)
+    client.add_block("table_row", {"cells": [[rich_text("c1")], [rich_text("c2")]]}, table)
+
+    assert get_body(client, page_id) == (
+        "<p>page<table>"
+        "<thead><tr><th>h1</th><th>h2</th></tr></thead>"
+        "<tr><td>c1</td><td>c2</td></tr>"
+        "</table></p>"
+    )
+
+
+def test_extract_page_html_synced_blocks_listed_once(client: FakeClient):
+    page_id = client.add_page("page")
+    original = client.add_block(
+        "synced_block",
+        {"synced_from": None},
+        parent_id=page_id,
+        has_children=True,
+    )
+    client.add_block("paragraph", text_block("synced"), parent_id=original)
+    duplicate = client.add_block(
+        "synced_block",
+        {"synced_from": {"type": "block_id", "block_id": original}},
+        parent_id=page_id,
+        has_children=True,
+    )
+    # The api lists the original block's children for a duplicate synced block
+    client.children[duplicate] = client.children[original]
+
+    assert get_body(client, page_id) == (
+        "<p>page<div><div>synced</div></div><div><div>synced</div></div></p>"
+    )
+    assert client.children_calls[original] == 1
+    assert client.children_calls[duplicate] == 0
+
+
+def test_extract_page_html_collects_child_pages_and_databases(client: FakeClient):
+    page_id = client.add_page("page")
+    child_page = client.add_page("child", parent_id=page_id)
+    client.add_block("paragraph", text_block("not fetched"), parent_id=child_page)
+    child_database = client.add_block("child_database", {"title": "db"}, parent_id=page_id)
+
+    response = extract_page_html(client=client, page_id=page_id, logger=logger)
+
+    assert response.child_pages == [child_page]
+    assert response.child_databases == [child_database]
+    assert client.children_calls[child_page] == 0
+
+
+def test_get_recursive_content_from_roots(client: FakeClient):
+    root = client.add_page("root")
+    child_page = client.add_page("child", parent_id=root)
+    client.add_block("link_to_page", {"type": "page_id", "page_id": child_page}, parent_id=root)
+    database = client.add_block("child_database", {"title": "db"}, parent_id=root)
+    row = client.add_database_row(database)
+    grandchild = client.add_page("grandchild", parent_id=child_page)
+    # Links back to the root shouldn't queue it again
+    client.add_block("link_to_page", {"type": "page_id", "page_id": root}, parent_id=grandchild)
+
+    response = get_recursive_content_from_roots(
+        client=client,
+        page_ids=[root],
+        database_ids=[],
+        logger=logger,
+    )
+
+    assert sorted(response.child_pages) == sorted([child_page, grandchild, row])
+    assert response.child_databases == [database]
+    assert all(calls == 1 for calls in client.children_calls.values())
+
+
+def test_get_recursive_content_skips_pages_that_fail(client: FakeClient):
+    root = client.add_page("root")
+    failing_page = client.add_page("failing", parent_id=root)
+    client.add_page("unreachable", parent_id=failing_page)
+    other_page = client.add_page("other", parent_id=root)
+    client.failing_ids.add(failing_page)
+
+    response = get_recursive_content_from_roots(
+        client=client,
+        page_ids=[root],
+        database_ids=[],
+        logger=logger,
+    )
+
+    assert response.child_pages == [other_page]
+
+
+NOTION_ID = "0a1b2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d"
+
+
+@pytest.mark.parametrize(
+    ("uuid_str", "expected"),
+    [
+        (NOTION_ID, True),
+        (NOTION_ID.upper(), True),
+        (NOTION_ID.replace("-", ""), True),
+        (NOTION_ID[:-1], False),
+        (NOTION_ID + "0", False),
+        (f"{{{NOTION_ID}}}", False),
+        ("", False),
+    ],
+)
+def test_is_valid_uuid(uuid_str: str, expected: bool):
+    assert is_valid_uuid(uuid_str) is expected
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("Page-Title-0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d", "0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d"),
+        ("0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d", "0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d"),
+        ("Page-Title", None),
+        ("", None),
+    ],
+)
+def test_get_uuid_from_url(path: str, expected: Optional[str]):
+    assert get_uuid_from_url(path) == expected
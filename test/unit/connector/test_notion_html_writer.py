@@ -0,0 +1,49 @@
+import io
+
+import pytest
+from htmlBuilder.attributes import Href, Style
+from htmlBuilder.tags import A, Body, Br, Div, Html, Li, P, Span, Table, Td, Tr, Ul
+
+from unstructured_ingest.connector.notion.html_writer import HtmlWriter
+
+
+def sample_html() -> Html:
+    return Html(
+        [],
+        Body(
+            [],
+            [
+                P([], "paragraph"),
+                Div([], []),
+                Div([Style("width:50.0%; float: left")], [P([], []), Br()]),
+                Ul([], [Li([], "one"), Li([], [A([Href("https://example.com")], "two")])]),
+                Table([], [Tr([], [Td([], "cell"), Td([], Div([], []))])]),
+            ],
+        ),
+    )
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_write_matches_render(pretty: bool):
+    html = sample_html()
+    assert HtmlWriter(pretty=pretty).write(html).getvalue() == html.render(pretty=pretty)
+
+
+def test_open_and_close_tags_match_render():
+    writer = HtmlWriter(pretty=True)
+    writer.open_tag("div")
+    writer.open_tag("p", [Style("color: red")])
+    writer.text("text")
+    writer.close_tag()
+    writer.open_tag("span")
+    writer.close_tag()
+    writer.close_tag()
+
+    expected = Div([], [P([Style("color: red")], "text"), Span([], [])])
+    assert writer.getvalue() == expected.render(pretty=True)
+
+
+def test_write_to_stream():
+    stream = io.StringIO()
+    HtmlWriter(stream=stream).write(P([], "text"))
+    assert stream.getvalue() == "<p>text</p>"
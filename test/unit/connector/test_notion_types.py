@@ -0,0 +1,47 @@
+import pytest
+
+from unstructured_ingest.connector.notion.types.database_properties.verification import (
+    VerificationData,
+)
+from unstructured_ingest.connector.notion.types.user import Bots, PartialUser, People
+
+
+@pytest.mark.parametrize(
+    ("verified_by", "expected_type"),
+    [
+        ({"object": "user", "id": "id", "type": "person", "name": "person"}, People),
+        ({"object": "user", "id": "id", "type": "bot", "name": "bot"}, Bots),
+        ({"object": "user", "id": "id"}, PartialUser),
+    ],
+)
+def test_verification_data_maps_verified_by(verified_by: dict, expected_type: type):
+    verification = VerificationData.from_dict(
+        {"state": "verified", "verified_by": verified_by, "date": None},
+    )
+    assert isinstance(verification.verified_by, expected_type)
+    assert verification.get_html() is not None
+
+
+def test_verification_data_invalid_verified_by():
+    with pytest.raises(ValueError):
+        VerificationData.from_dict(
+            {"state": "verified", "verified_by": {"object": "group", "id": "id"}},
+        )
+
+
+def test_user_html_is_escaped():
+    user = People(object="user", id="id", name="<b>", avatar_url="https://example.com/a'b")
+    assert user.get_html().render() == "<a href='https://example.com/a&#x27;b'>&lt;b&gt;</a>"
+
+
+@pytest.mark.parametrize(
+    ("avatar_url", "expected"),
+    [
+        (None, "<div></div>"),
+        ("https://example.com", "<a href='https://example.com'></a>"),
+    ],
+)
+@pytest.mark.parametrize("user_type", [People, Bots])
+def test_user_html_without_name(user_type: type, avatar_url: str, expected: str):
+    user = user_type(object="user", id="id", avatar_url=avatar_url)
+    assert user.get_html().render() == expected
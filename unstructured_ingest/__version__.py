@@ -1 +1 @@
-__version__ = "0.3.5"  # pragma: no cover
+__version__ = "0.3.6"  # pragma: no cover
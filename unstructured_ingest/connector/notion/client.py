@@ -1,4 +1,7 @@
-from typing import Any, Generator, List, Optional, Tuple, Union
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Generator, List, Optional, Tuple, Union
 
 import notion_client.errors
 from notion_client import Client as NotionClient
@@ -7,7 +10,7 @@ from notion_client.api_endpoints import BlocksEndpoint as NotionBlocksEndpoint
 from notion_client.api_endpoints import DatabasesEndpoint as NotionDatabasesEndpoint
 from notion_client.api_endpoints import Endpoint
 from notion_client.api_endpoints import PagesEndpoint as NotionPagesEndpoint
-from notion_client.errors import RequestTimeoutError
+from notion_client.errors import APIErrorCode, APIResponseError, RequestTimeoutError
 from notion_client.helpers import is_full_page, is_full_database
 
 from unstructured_ingest.connector.notion.types.block import Block
@@ -18,7 +21,61 @@ from unstructured_ingest.connector.notion.types.database_properties import (
 from unstructured_ingest.connector.notion.types.page import Page
 from unstructured_ingest.ingest_backoff import RetryHandler
 from unstructured_ingest.interfaces import RetryStrategyConfig
-from unstructured_ingest.utils.dep_check import requires_dependencies
+from unstructured_ingest.utils.dep_check import dependency_exists, requires_dependencies
+
+if TYPE_CHECKING:
+    import httpx
+
+
+MAX_RATE_LIMITED_RETRIES = 5
+
+
+class RateLimiter:
+    """Token bucket shared by every thread using a client. Up to `burst` requests are sent
+    straight away, after which they are let through at `requests_per_second` on average. Without
+    a rate, requests are only held back while Notion has asked for a pause after a 429."""
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+    ):
+        self.requests_per_second = requests_per_second
+        self.burst = burst or max(1, math.ceil(requests_per_second or 1))
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._resume_at = 0.0
+
+    def wait(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                delay = self._resume_at - now
+                if delay <= 0:
+                    if not self.requests_per_second:
+                        return
+                    self._tokens = min(
+                        float(self.burst),
+                        self._tokens + (now - self._updated_at) * self.requests_per_second,
+                    )
+                    self._updated_at = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    delay = (1 - self._tokens) / self.requests_per_second
+            time.sleep(delay)
+
+    def pause(self, seconds: float):
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def get_retry_after(headers: Any, attempt: int) -> float:
+    try:
+        return float(headers["retry-after"])
+    except (KeyError, TypeError, ValueError):
+        return float(2**attempt)
 
 
 @requires_dependencies(["httpx"], extras="notion")
@@ -128,9 +185,9 @@ class DatabasesEndpoint(NotionDatabasesEndpoint):
         )
         try:
             response: httpx.Response = (
-                self.retry_handler(self.parent.client.send, request)
+                self.retry_handler(self.parent.send, request)
                 if (self.retry_handler)
-                else (self.parent.client.send(request))
+                else (self.parent.send(request))
             )  # type: ignore
             return response.status_code
         except httpx.TimeoutException:
@@ -242,9 +299,9 @@ class PagesEndpoint(NotionPagesEndpoint):
         )
         try:
             response: httpx.Response = (
-                self.retry_handler(self.parent.client.send, request)
+                self.retry_handler(self.parent.send, request)
                 if (self.retry_handler)
-                else (self.parent.client.send(request))
+                else (self.parent.send(request))
             )  # type: ignore
             return response.status_code
         except httpx.TimeoutException:
@@ -256,9 +313,49 @@ class Client(NotionClient):
         self,
         *args: Any,
         retry_strategy_config: Optional[RetryStrategyConfig] = None,
+        requests_per_second: Optional[float] = None,
         **kwargs: Any,
     ) -> None:
+        # When http/2 support is installed, the requests made concurrently while crawling are
+        # multiplexed over a single connection rather than each opening their own
+        if "client" not in kwargs and dependency_exists("h2"):
+            import httpx
+
+            kwargs["client"] = httpx.Client(http2=True)
         super().__init__(*args, **kwargs)
         self.blocks = BlocksEndpoint(retry_strategy_config=retry_strategy_config, parent=self)
         self.pages = PagesEndpoint(retry_strategy_config=retry_strategy_config, parent=self)
         self.databases = DatabasesEndpoint(retry_strategy_config=retry_strategy_config, parent=self)
+        # Shared by every thread using this client, as the crawl fetches siblings concurrently
+        self.rate_limiter = RateLimiter(requests_per_second=requests_per_second)
+
+    def __deepcopy__(self, memo):
+        # Serializing an ingest doc deep copies its session handle before dropping it, the
+        # connection pool and rate limiter can't be copied and the client is only ever shared
+        # within a process, so the same client is returned
+        return self
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        attempt = 0
+        while True:
+            self.rate_limiter.wait()
+            try:
+                return super().request(*args, **kwargs)
+            except APIResponseError as error:
+                if error.code != APIErrorCode.RateLimited or attempt >= MAX_RATE_LIMITED_RETRIES:
+                    raise
+                self.rate_limiter.pause(get_retry_after(headers=error.headers, attempt=attempt))
+                attempt += 1
+
+    def send(self, request: "httpx.Request") -> "httpx.Response":
+        """Sends a request built outside of the api endpoints, such as the HEAD requests used to
+        check that pages and databases exist, under the same rate limiting as every other
+        request."""
+        attempt = 0
+        while True:
+            self.rate_limiter.wait()
+            response = self.client.send(request)
+            if response.status_code != 429 or attempt >= MAX_RATE_LIMITED_RETRIES:
+                return response
+            self.rate_limiter.pause(get_retry_after(headers=response.headers, attempt=attempt))
+            attempt += 1
@@ -1,4 +1,7 @@
+import os
+import re
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from uuid import UUID
@@ -8,9 +11,12 @@ from unstructured_ingest.error import SourceConnectionError
 from unstructured_ingest.interfaces import (
     AccessConfig,
     BaseConnectorConfig,
+    BaseSessionHandle,
     BaseSingleIngestDoc,
     BaseSourceConnector,
+    ConfigSessionHandleMixin,
     IngestDocCleanupMixin,
+    IngestDocSessionHandleMixin,
     RetryStrategyConfig,
     SourceConnectorCleanupMixin,
 )
@@ -30,7 +36,49 @@ class NotionAccessConfig(AccessConfig):
 
 
 @dataclass
-class SimpleNotionConfig(BaseConnectorConfig):
+class NotionSessionHandle(BaseSessionHandle):
+    client: "NotionClient"
+
+
+CANONICAL_UUID_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+)
+
+
+def normalize_id(notion_id: str) -> str:
+    notion_id = notion_id.strip()
+    # The config is rebuilt from its serialized form in every worker, by which point the ids
+    # are already in the canonical form str(UUID(...)) produces
+    if CANONICAL_UUID_PATTERN.match(notion_id):
+        return notion_id
+    return str(UUID(notion_id))
+
+
+def pretty_html() -> bool:
+    """Whether downloaded pages and databases are written as indented html.
+
+    Indented html is the default. Setting NOTION_PRETTY_HTML=false writes compact html, which
+    is roughly half the size, but partitioning it gives different element text as the
+    whitespace indentation adds between inline elements is no longer there.
+    """
+    return os.getenv("NOTION_PRETTY_HTML", "true").lower() == "true"
+
+
+def requests_per_second() -> t.Optional[float]:
+    """The average rate each process sends requests to Notion at.
+
+    Unset by default, requests are only slowed down once Notion responds that its rate limit was
+    hit, after which they wait as long as it asks before being retried. Setting
+    NOTION_REQUESTS_PER_SECOND paces each process's requests at that rate, while still letting
+    through short bursts.
+    """
+    if rate := os.getenv("NOTION_REQUESTS_PER_SECOND"):
+        return float(rate)
+    return None
+
+
+@dataclass
+class SimpleNotionConfig(ConfigSessionHandleMixin, BaseConnectorConfig):
     """Connector config to process all messages by channel id's."""
 
     access_config: NotionAccessConfig
@@ -40,14 +88,59 @@ class SimpleNotionConfig(BaseConnectorConfig):
 
     def __post_init__(self):
         if self.page_ids:
-            self.page_ids = [str(UUID(p.strip())) for p in self.page_ids]
+            self.page_ids = [normalize_id(p) for p in self.page_ids]
 
         if self.database_ids:
-            self.database_ids = [str(UUID(d.strip())) for d in self.database_ids]
+            self.database_ids = [normalize_id(d) for d in self.database_ids]
+
+    @requires_dependencies(dependencies=["notion_client"], extras="notion")
+    def create_session_handle(
+        self,
+        retry_strategy_config: t.Optional[RetryStrategyConfig] = None,
+    ) -> NotionSessionHandle:
+        from unstructured_ingest.connector.notion.client import Client as NotionClient
+
+        # Pin the version of the api to avoid schema changes
+        client = NotionClient(
+            notion_version=NOTION_API_VERSION,
+            auth=self.access_config.notion_api_key,
+            logger=logger,
+            log_level=logger.level,
+            retry_strategy_config=retry_strategy_config,
+            requests_per_second=requests_per_second(),
+        )
+        return NotionSessionHandle(client=client)
+
+
+class NotionIngestDocSessionHandleMixin(IngestDocSessionHandleMixin):
+    connector_config: SimpleNotionConfig
+    retry_strategy_config: t.Optional[RetryStrategyConfig]
+
+    @property
+    def session_handle(self) -> NotionSessionHandle:
+        """If a session handle is not assigned, creates a new one with the ingest doc's retry
+        strategy and assigns it. The pipeline shares it across every document handled by the
+        same process."""
+        if self._session_handle is None:
+            self._session_handle = self.connector_config.create_session_handle(
+                retry_strategy_config=self.retry_strategy_config,
+            )
+        return self._session_handle
+
+    @session_handle.setter
+    def session_handle(self, session_handle: NotionSessionHandle):
+        self._session_handle = session_handle
+
+    def get_client(self) -> "NotionClient":
+        return self.session_handle.client
 
 
 @dataclass
-class NotionPageIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
+class NotionPageIngestDoc(
+    NotionIngestDocSessionHandleMixin,
+    IngestDocCleanupMixin,
+    BaseSingleIngestDoc,
+):
     """Class encapsulating fetching a doc and writing processed results (but not
     doing the processing!).
 
@@ -72,25 +165,13 @@ class NotionPageIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
     def _create_full_tmp_dir_path(self):
         self._tmp_download_file().parent.mkdir(parents=True, exist_ok=True)
 
-    @requires_dependencies(dependencies=["notion_client"], extras="notion")
-    def get_client(self):
-        from unstructured_ingest.connector.notion.client import Client as NotionClient
-
-        # Pin the version of the api to avoid schema changes
-        return NotionClient(
-            notion_version=NOTION_API_VERSION,
-            auth=self.connector_config.access_config.notion_api_key,
-            logger=logger,
-            log_level=logger.level,
-            retry_strategy_config=self.retry_strategy_config,
-        )
-
     @BaseSingleIngestDoc.skip_if_file_exists
     @requires_dependencies(dependencies=["notion_client"], extras="notion")
     def get_file(self):
         from notion_client import APIErrorCode, APIResponseError
 
         from unstructured_ingest.connector.notion.helpers import extract_page_html
+        from unstructured_ingest.connector.notion.html_writer import HtmlWriter
 
         self._create_full_tmp_dir_path()
 
@@ -106,7 +187,7 @@ class NotionPageIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
             self.file_exists = True
             if html := text_extraction.html:
                 with open(self._tmp_download_file(), "w") as page_file:
-                    page_file.write(html.render(pretty=True))
+                    HtmlWriter(stream=page_file, pretty=pretty_html()).write(html)
 
         except APIResponseError as error:
             if error.code == APIErrorCode.ObjectNotFound:
@@ -167,7 +248,11 @@ class NotionPageIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
 
 
 @dataclass
-class NotionDatabaseIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
+class NotionDatabaseIngestDoc(
+    NotionIngestDocSessionHandleMixin,
+    IngestDocCleanupMixin,
+    BaseSingleIngestDoc,
+):
     """Class encapsulating fetching a doc and writing processed results (but not
     doing the processing!).
 
@@ -192,25 +277,13 @@ class NotionDatabaseIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
     def _create_full_tmp_dir_path(self):
         self._tmp_download_file().parent.mkdir(parents=True, exist_ok=True)
 
-    @requires_dependencies(dependencies=["notion_client"], extras="notion")
-    def get_client(self):
-        from unstructured_ingest.connector.notion.client import Client as NotionClient
-
-        # Pin the version of the api to avoid schema changes
-        return NotionClient(
-            notion_version=NOTION_API_VERSION,
-            auth=self.connector_config.access_config.notion_api_key,
-            logger=logger,
-            log_level=logger.level,
-            retry_strategy_config=self.retry_strategy_config,
-        )
-
     @BaseSingleIngestDoc.skip_if_file_exists
     @requires_dependencies(dependencies=["notion_client"], extras="notion")
     def get_file(self):
         from notion_client import APIErrorCode, APIResponseError
 
         from unstructured_ingest.connector.notion.helpers import extract_database_html
+        from unstructured_ingest.connector.notion.html_writer import HtmlWriter
 
         self._create_full_tmp_dir_path()
 
@@ -226,7 +299,7 @@ class NotionDatabaseIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
             self.file_exists = True
             if html := text_extraction.html:
                 with open(self._tmp_download_file(), "w") as page_file:
-                    page_file.write(html.render(pretty=True))
+                    HtmlWriter(stream=page_file, pretty=pretty_html()).write(html)
 
         except APIResponseError as error:
             if error.code == APIErrorCode.ObjectNotFound:
@@ -295,6 +368,7 @@ class NotionSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
     connector_config: SimpleNotionConfig
     retry_strategy_config: t.Optional[RetryStrategyConfig] = None
     _client: t.Optional["NotionClient"] = field(init=False, default=None)
+    _validated: bool = field(init=False, default=False)
 
     @property
     def client(self) -> "NotionClient":
@@ -302,26 +376,33 @@ class NotionSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
             self._client = self.create_client()
         return self._client
 
-    @requires_dependencies(dependencies=["notion_client"], extras="notion")
     def create_client(self) -> "NotionClient":
-        from unstructured_ingest.connector.notion.client import Client as NotionClient
-
-        return NotionClient(
-            notion_version=NOTION_API_VERSION,
-            auth=self.connector_config.access_config.notion_api_key,
-            logger=logger,
-            log_level=logger.level,
+        session_handle = self.connector_config.create_session_handle(
             retry_strategy_config=self.retry_strategy_config,
         )
+        return session_handle.client
+
+    def close(self):
+        """Closes the connection pool of the client, if one was created."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def cleanup(self, cur_dir=None):
+        self.close()
+        super().cleanup(cur_dir=cur_dir)
 
     @requires_dependencies(["httpx"], extras="notion")
     def check_connection(self):
         import httpx
 
+        if self._validated:
+            return
         try:
             request = self.client._build_request("HEAD", "users")
-            response = self.client.client.send(request)
+            response = self.client.send(request)
             response.raise_for_status()
+            self._validated = True
         except httpx.HTTPStatusError as http_error:
             logger.error(f"failed to validate connection: {http_error}", exc_info=True)
             raise SourceConnectionError(f"failed to validate connection: {http_error}")
@@ -332,53 +413,42 @@ class NotionSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
         _ = self.client
 
     @requires_dependencies(dependencies=["notion_client"], extras="notion")
-    def get_child_page_content(self, page_id: str):
+    def get_recursive_child_content(self):
         from unstructured_ingest.connector.notion.helpers import (
-            get_recursive_content_from_page,
+            MAX_CONCURRENT_REQUESTS,
+            get_recursive_content_from_roots,
         )
 
-        # sanity check that database id is valid
-        resp_code = self.client.pages.retrieve_status(page_id=page_id)
-        if resp_code != 200:
-            raise ValueError(
-                f"page associated with page id could not be found: {page_id}",
-            )
+        page_ids = self.connector_config.page_ids or []
+        database_ids = self.connector_config.database_ids or []
 
-        child_content = get_recursive_content_from_page(
-            client=self.client,
-            page_id=page_id,
-            logger=logger,
-        )
-        return child_content
-
-    def get_child_content(self, page_id: str):
-        from unstructured_ingest.connector.notion.helpers import (
-            get_recursive_content_from_page,
-        )
-
-        child_content = get_recursive_content_from_page(
-            client=self.client,
-            page_id=page_id,
-            logger=logger,
-        )
-        return child_content
-
-    @requires_dependencies(dependencies=["notion_client"], extras="notion")
-    def get_child_database_content(self, database_id: str):
-        from unstructured_ingest.connector.notion.helpers import (
-            get_recursive_content_from_database,
-        )
-
-        # sanity check that database id is valid
-        resp_code = self.client.databases.retrieve_status(database_id=database_id)
-        if resp_code != 200:
-            raise ValueError(
-                f"database associated with database id could not be found: {database_id}",
+        # sanity check that all page and database ids are valid, each check is its own request
+        # so they are sent concurrently
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            page_resp_codes = executor.map(
+                lambda page_id: self.client.pages.retrieve_status(page_id=page_id),
+                page_ids,
+            )
+            database_resp_codes = executor.map(
+                lambda database_id: self.client.databases.retrieve_status(database_id=database_id),
+                database_ids,
             )
+            for page_id, resp_code in zip(page_ids, page_resp_codes):
+                if resp_code != 200:
+                    raise ValueError(
+                        f"page associated with page id could not be found: {page_id}",
+                    )
+            for database_id, resp_code in zip(database_ids, database_resp_codes):
+                if resp_code != 200:
+                    raise ValueError(
+                        f"database associated with database id could not be found: {database_id}",
+                    )
 
-        child_content = get_recursive_content_from_database(
+        # Every root is crawled in the same pass rather than one after the other
+        child_content = get_recursive_content_from_roots(
             client=self.client,
-            database_id=database_id,
+            page_ids=page_ids,
+            database_ids=database_ids,
             logger=logger,
         )
         return child_content
@@ -409,30 +479,10 @@ class NotionSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
             ]
         if self.connector_config.recursive:
             logger.info("Getting recursive content")
-            child_pages = []
-            child_databases = []
-            if self.connector_config.page_ids:
-                for page_id in self.connector_config.page_ids:
-                    child_content = self.get_child_page_content(page_id=page_id)
-                    child_pages.extend(child_content.child_pages)
-                    child_databases.extend(child_content.child_databases)
-
-            if self.connector_config.database_ids:
-                for database_id in self.connector_config.database_ids:
-                    child_content = self.get_child_database_content(database_id=database_id)
-                    child_pages.extend(child_content.child_pages)
-                    child_databases.extend(child_content.child_databases)
-
-            # Remove duplicates
-            child_pages = list(set(child_pages))
-            if self.connector_config.page_ids:
-                child_pages = [c for c in child_pages if c not in self.connector_config.page_ids]
-
-            child_databases = list(set(child_databases))
-            if self.connector_config.database_ids:
-                child_databases = [
-                    db for db in child_databases if db not in self.connector_config.database_ids
-                ]
+            # The crawl only reports each id once and never reports the configured roots
+            child_content = self.get_recursive_child_content()
+            child_pages = child_content.child_pages
+            child_databases = child_content.child_databases
 
             if child_pages:
                 logger.info(
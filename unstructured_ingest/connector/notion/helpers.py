@@ -1,9 +1,12 @@
 import enum
 import logging
+import re
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Set, TypeVar, Union
 from urllib.parse import urlparse
-from uuid import UUID
 
 from htmlBuilder.attributes import Style, Type
 from htmlBuilder.tags import (
@@ -26,148 +29,287 @@ from notion_client.errors import APIResponseError
 
 import unstructured_ingest.connector.notion.types.blocks as notion_blocks
 from unstructured_ingest.connector.notion.client import Client
-from unstructured_ingest.connector.notion.interfaces import BlockBase
+from unstructured_ingest.connector.notion.interfaces import DATACLASS_SLOTS, BlockBase
 from unstructured_ingest.connector.notion.types.block import Block
 from unstructured_ingest.connector.notion.types.page import Page
 from unstructured_ingest.connector.notion.types.database import Database
 from unstructured_ingest.connector.notion.types.parent import DatabaseParent
 
-HtmlElement = Tuple[BlockBase, HtmlTag]
+T = TypeVar("T")
 
 
-@dataclass
+class HtmlElement(NamedTuple):
+    block: BlockBase
+    html: HtmlTag
+
+
+# Sibling fetches are run concurrently to overlap their latency, the client retries any request
+# Notion rejects for going over its rate limit
+MAX_CONCURRENT_REQUESTS = 4
+
+
+def list_children(client: Client, block_id: str) -> List[Block]:
+    children: List[Block] = []
+    for child_blocks in client.blocks.children.iterate_list(  # type: ignore
+        block_id=block_id,
+    ):
+        children.extend(child_blocks)
+    return children
+
+
+def list_children_concurrently(client: Client, block_ids: List[str]) -> Dict[str, List[Block]]:
+    if len(block_ids) <= 1:
+        return {block_id: list_children(client=client, block_id=block_id) for block_id in block_ids}
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(block_ids))) as executor:
+        children = executor.map(
+            lambda block_id: list_children(client=client, block_id=block_id),
+            block_ids,
+        )
+        return dict(zip(block_ids, children))
+
+
+def prefetch(iterator: Iterator[T]) -> Iterator[T]:
+    # Pull items from the iterator on a background thread so that, when each item is a page of
+    # api results, the next request is already in flight while the current one is processed
+    done = object()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, iterator, done)
+        while (item := future.result()) is not done:
+            future = executor.submit(next, iterator, done)
+            yield item  # type: ignore
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ProcessBlockResponse:
     html_element: HtmlElement
     child_pages: List[str] = field(default_factory=list)
     child_databases: List[str] = field(default_factory=list)
 
 
-def process_block(
-    client: Client,
-    logger: logging.Logger,
-    parent_block: Block,
-    start_level: int = 0,
-) -> ProcessBlockResponse:
-    block_id_uuid = UUID(parent_block.id)
-    children_html_elements: List[HtmlElement] = []
+class BlockNodeType(enum.Enum):
+    BLOCK = "block"
+    TABLE = "table"
+    TABLE_ROW = "table_row"
+    COLUMN_LIST = "column_list"
+    CHILD_PAGE = "child_page"
+    CHILD_DATABASE = "child_database"
+
+
+# Nodes that are never expanded and have no html built for them, their parent only reads
+# the block itself, so they are kept out of the traversal levels
+TERMINAL_NODE_TYPES = {
+    BlockNodeType.CHILD_PAGE,
+    BlockNodeType.CHILD_DATABASE,
+    BlockNodeType.TABLE_ROW,
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
+class BlockNode:
+    type: BlockNodeType
+    block: Block
+    level: int
+    children: List["BlockNode"] = field(default_factory=list)
+    response: Optional[
+        Union[ProcessBlockResponse, "BuildTableResponse", "BuildColumnedListResponse"]
+    ] = None
+
+
+# Block types that are handled by something other than the generic block html, any block
+# type not listed here is a plain BLOCK node
+block_node_type_mapping = {
+    notion_blocks.ChildPage: BlockNodeType.CHILD_PAGE,
+    notion_blocks.ChildDatabase: BlockNodeType.CHILD_DATABASE,
+    notion_blocks.Table: BlockNodeType.TABLE,
+    notion_blocks.ColumnList: BlockNodeType.COLUMN_LIST,
+}
+
+
+def get_child_node_type(parent: BlockNode, child_block: Block) -> BlockNodeType:
+    if parent.type == BlockNodeType.TABLE:
+        return BlockNodeType.TABLE_ROW
+    if parent.type == BlockNodeType.COLUMN_LIST:
+        return BlockNodeType.BLOCK
+    node_type = block_node_type_mapping.get(type(child_block.block), BlockNodeType.BLOCK)
+    if node_type == BlockNodeType.CHILD_PAGE and child_block.id == parent.block.id:
+        return BlockNodeType.BLOCK
+    return node_type
+
+
+def get_children_cache_key(block: Block) -> str:
+    # A duplicate synced block mirrors the content of the original block it was synced from, so
+    # both share the same children and only need to be listed once
+    if isinstance(block.block, notion_blocks.DuplicateSyncedBlock):
+        return block.block.block_id
+    return block.id
+
+
+def should_expand_node(node: BlockNode, logger: logging.Logger) -> bool:
+    if node.type in (BlockNodeType.TABLE, BlockNodeType.COLUMN_LIST):
+        return True
+    if node.type != BlockNodeType.BLOCK or not node.block.has_children:
+        return False
+    if isinstance(node.block.block, notion_blocks.Unsupported):
+        logger.warning(f"Unsupported block type: {node.block.block} has children - skipping")
+        return False
+    if not node.block.block.can_have_children:
+        raise ValueError(f"Block type cannot have children: {type(node.block.block)}")
+    return True
+
+
+def build_block_tree(client: Client, logger: logging.Logger, root: BlockNode) -> BlockNode:
+    # Walk the tree one depth at a time so the children of every block at a given depth are
+    # fetched as a single batch, then build the html bottom-up once all the blocks are known
+    levels: List[List[BlockNode]] = []
+    # Children already listed during this traversal, keyed by get_children_cache_key
+    fetched_children: Dict[str, List[Block]] = {}
+    nodes = [root]
+    while nodes:
+        levels.append(nodes)
+        parents = [node for node in nodes if should_expand_node(node=node, logger=logger)]
+        to_fetch: Dict[str, str] = {}
+        for parent in parents:
+            cache_key = get_children_cache_key(parent.block)
+            if cache_key not in fetched_children and cache_key not in to_fetch:
+                to_fetch[cache_key] = parent.block.id
+        children = list_children_concurrently(client=client, block_ids=list(to_fetch.values()))
+        fetched_children.update(
+            {cache_key: children[block_id] for cache_key, block_id in to_fetch.items()},
+        )
+        nodes = []
+        for parent in parents:
+            child_blocks = fetched_children[get_children_cache_key(parent.block)]
+            logger.debug(f"adding {len(child_blocks)} children from parent: {parent.block}")
+            parent.children = [
+                BlockNode(
+                    type=get_child_node_type(parent=parent, child_block=child_block),
+                    block=child_block,
+                    level=parent.level + 1,
+                )
+                for child_block in child_blocks
+            ]
+            nodes.extend(
+                child for child in parent.children if child.type not in TERMINAL_NODE_TYPES
+            )
+
+    for nodes in reversed(levels):
+        for node in nodes:
+            if node.type == BlockNodeType.BLOCK:
+                node.response = build_block_response(node=node, logger=logger)
+            elif node.type == BlockNodeType.TABLE:
+                node.response = build_table_response(
+                    table=node.block,
+                    rows=[child.block for child in node.children],
+                )
+            elif node.type == BlockNodeType.COLUMN_LIST:
+                node.response = build_columned_list_response(
+                    column_parent=node.block,
+                    columns=[child.response for child in node.children],  # type: ignore
+                )
+    return root
+
+
+def build_block_response(node: BlockNode, logger: logging.Logger) -> ProcessBlockResponse:
+    parent_block = node.block
     child_pages: List[str] = []
     child_databases: List[str] = []
-    children: List[Tuple[int, Block]] = []
 
     parent_html = parent_block.get_html() or Div([], [])
-    if parent_block.has_children:
-        if isinstance(parent_block.block, notion_blocks.Unsupported):
-            logger.warning(f"Unsupported block type: {parent_block.block} has children - skipping")
-            return ProcessBlockResponse(
-                html_element=(parent_block.block, parent_html),
-                child_pages=child_pages,
-                child_databases=child_databases,
-            )
-
-        if not parent_block.block.can_have_children():
-            raise ValueError(f"Block type cannot have children: {type(parent_block.block)}")
-
-        for child_blocks in client.blocks.children.iterate_list(  # type: ignore
-            block_id=parent_block.id,
-        ):
-            for child_block in child_blocks:
-                children.append((start_level + 1, child_block))
-        logger.debug(f"adding {len(children)} children from parent: {parent_block}")
-        for child_level, child_block in children:
+    if node.children:
+        joined_html: List[HtmlTag] = []
+        # Consecutive list items are held back and flushed as a single list once a
+        # non-list block comes along
+        numbered_list_items: List[HtmlTag] = []
+        bullet_list_items: List[HtmlTag] = []
+        type_attr_ind = (node.level + 1) % len(numbered_list_types)
+        list_style_ind = (node.level + 1) % len(bulleted_list_styles)
+        for child in node.children:
+            child_block = child.block
             logger.debug(f"processing child block: {child_block}")
-            if isinstance(child_block.block, notion_blocks.ChildPage) and child_block.id != str(block_id_uuid):
+            if child.type == BlockNodeType.CHILD_PAGE:
                 child_pages.append(child_block.id)
                 continue
-            elif isinstance(child_block.block, notion_blocks.ChildDatabase):
+            elif child.type == BlockNodeType.CHILD_DATABASE:
                 child_databases.append(child_block.id)
                 continue
-            elif isinstance(child_block.block, notion_blocks.Table):
-                table_response = build_table(client=client, table=child_block)
-                children_html_elements.append((child_block.block, table_response.table_html))
+            elif child.type == BlockNodeType.TABLE:
+                table_response: BuildTableResponse = child.response  # type: ignore
                 child_pages.extend(table_response.child_pages)
                 child_databases.extend(table_response.child_databases)
-                continue
-            elif isinstance(child_block.block, notion_blocks.ColumnList):
-                build_columned_list_response = build_columned_list(client=client, logger=logger, column_parent=child_block, level=child_level)
+                html = table_response.table_html
+            elif child.type == BlockNodeType.COLUMN_LIST:
+                build_columned_list_response: BuildColumnedListResponse = child.response  # type: ignore
                 child_pages.extend(build_columned_list_response.child_pages)
                 child_databases.extend(build_columned_list_response.child_databases)
-                children_html_elements.append((child_block.block, build_columned_list_response.columned_list_html))
-                continue
-
-            child_block_response = process_block(
-                client=client,
-                logger=logger,
-                parent_block=child_block,
-                start_level=child_level,
-            )
-            child_block_response_block, child_block_response_html = child_block_response.html_element
-
-            if isinstance(child_block.block, notion_blocks.BulletedListItem):
-                bulleted_list_response = build_bulleted_list_item(html=child_block_response_html)
-                children_html_elements.append((child_block.block, bulleted_list_response.html))
-            elif isinstance(child_block.block, notion_blocks.NumberedListItem):
-                numbered_list_resp = build_numbered_list_item(html=child_block_response_html)
-                children_html_elements.append((child_block.block, numbered_list_resp.html))
+                html = build_columned_list_response.columned_list_html
             else:
+                child_block_response: ProcessBlockResponse = child.response  # type: ignore
+                html = child_block_response.html_element.html
+                if isinstance(child_block.block, notion_blocks.BulletedListItem):
+                    bullet_list_items.append(build_bulleted_list_item(html=html).html)
+                    continue
+                elif isinstance(child_block.block, notion_blocks.NumberedListItem):
+                    numbered_list_items.append(build_numbered_list_item(html=html).html)
+                    continue
                 child_pages.extend(child_block_response.child_pages)
                 child_databases.extend(child_block_response.child_databases)
-                children_html_elements.append(child_block_response.html_element)
-
-        # Join list items
-        joined_html_elements: List[HtmlElement] = []
-        numbered_list_items = []
-        bullet_list_items = []
-        type_attr_ind = (start_level + 1) % len(numbered_list_types)
-        list_style_ind = (start_level + 1) % len(bulleted_list_styles)
-        for block, html in children_html_elements:
-            if isinstance(block, notion_blocks.BulletedListItem):
-                bullet_list_items.append(html)
-                continue
-            elif isinstance(block, notion_blocks.NumberedListItem):
-                numbered_list_items.append(html)
-                continue
-            elif len(numbered_list_items) > 0:
-                joined_html_elements.append((block, Ol([Type(numbered_list_types[type_attr_ind])], numbered_list_items)))
+
+            if len(numbered_list_items) > 0:
+                joined_html.append(
+                    Ol([Type(numbered_list_types[type_attr_ind])], numbered_list_items),
+                )
                 numbered_list_items = []
             elif len(bullet_list_items) > 0:
-                joined_html_elements.append((block, Ul([Type(bulleted_list_styles[list_style_ind])], bullet_list_items)))
+                joined_html.append(
+                    Ul([Type(bulleted_list_styles[list_style_ind])], bullet_list_items),
+                )
                 bullet_list_items = []
             if html:
-                joined_html_elements.append((block, html))
+                joined_html.append(html)
 
         if len(numbered_list_items) > 0:
-            joined_html_elements.append((block, Ol([Type(numbered_list_types[type_attr_ind])], numbered_list_items)))
+            joined_html.append(Ol([Type(numbered_list_types[type_attr_ind])], numbered_list_items))
         if len(bullet_list_items) > 0:
-            joined_html_elements.append((block, Ul([Type(bulleted_list_styles[list_style_ind])], bullet_list_items)))
+            joined_html.append(Ul([Type(bulleted_list_styles[list_style_ind])], bullet_list_items))
 
-        parent_html.inner_html.extend([html for block, html in joined_html_elements])
+        parent_html.inner_html.extend(joined_html)
 
     return ProcessBlockResponse(
-        html_element=(parent_block.block, parent_html),
+        html_element=HtmlElement(block=parent_block.block, html=parent_html),
         child_pages=child_pages,
         child_databases=child_databases,
     )
 
 
-@dataclass
+def process_block(
+    client: Client,
+    logger: logging.Logger,
+    parent_block: Block,
+    start_level: int = 0,
+) -> ProcessBlockResponse:
+    root = build_block_tree(
+        client=client,
+        logger=logger,
+        root=BlockNode(type=BlockNodeType.BLOCK, block=parent_block, level=start_level),
+    )
+    return root.response  # type: ignore
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TextExtractionResponse:
     text: Optional[str] = None
     child_pages: List[str] = field(default_factory=list)
     child_databases: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HtmlExtractionResponse:
     html: Optional[HtmlTag] = None
     child_pages: List[str] = field(default_factory=list)
     child_databases: List[str] = field(default_factory=list)
 
 
-def get_table_html(
-    pages_or_databases: List[Union[Page, Database]],
-    properties: Dict[str, Any],
-    logger: logging.Logger,
-) -> Table:
+def get_table_property_keys(properties: Dict[str, Any]) -> List[str]:
     property_keys = list(properties.keys())
     property_keys = sorted(property_keys)
 
@@ -176,26 +318,45 @@ def get_table_html(
     if title_key:
         property_keys.remove(title_key)
         property_keys.insert(0, title_key)
+    return property_keys
 
-    table_header_rows: List[Tr] = []
-    table_body_rows: List[Tr] = []
-    # Create header row
-    table_header_rows.append(Tr([], [Th([], k) for k in property_keys]))
 
+def get_table_row_html(properties: Dict[str, Any], property_keys: List[str]) -> Tr:
+    return Tr([], [Td([], properties[k].get_html() or Div([], [])) for k in property_keys])
+
+
+def get_table_rows_html(
+    pages_or_databases: List[Union[Page, Database]],
+    property_keys: List[str],
+    logger: logging.Logger,
+) -> List[Tr]:
     logger.debug(f"creating {len(pages_or_databases)} rows")
-    for page in pages_or_databases:
-        if isinstance(page, Database):
-            continue
-        properties = page.properties
-        inner_html = [properties.get(k).get_html() for k in property_keys]  # type: ignore
-        table_body_rows.append(
-            Tr(
-                [],
-                [Td([], cell) for cell in [html if html else Div([], []) for html in inner_html]],
-            ),
-        )
+    return [
+        get_table_row_html(properties=page.properties, property_keys=property_keys)
+        for page in pages_or_databases
+        if not isinstance(page, Database)
+    ]
+
+
+def build_table_from_rows(property_keys: List[str], table_body_rows: List[Tr]) -> Table:
+    table_header_rows: List[Tr] = [Tr([], [Th([], k) for k in property_keys])]
+    return Table([], [Thead([], table_header_rows), Tbody([], table_body_rows)])
+
 
-    return Table([], [Thead([], table_header_rows)] + [Tbody([], table_body_rows)])
+def get_table_html(
+    pages_or_databases: List[Union[Page, Database]],
+    properties: Dict[str, Any],
+    logger: logging.Logger,
+) -> Table:
+    property_keys = get_table_property_keys(properties=properties)
+    return build_table_from_rows(
+        property_keys=property_keys,
+        table_body_rows=get_table_rows_html(
+            pages_or_databases=pages_or_databases,
+            property_keys=property_keys,
+            logger=logger,
+        ),
+    )
 
 
 def extract_page_html(
@@ -229,7 +390,7 @@ def extract_page_html(
         parent_block=parent_block,
         start_level=0,
     )
-    _, body_child_html = process_block_response.html_element
+    body_child_html = process_block_response.html_element.html
     body_elements.append(body_child_html)
     body = Body([], body_elements)
     all_elements = [body]
@@ -262,28 +423,36 @@ def extract_database_html(
         parent_block=parent_block,
         start_level=0,
     )
-    _, body_child_html = process_block_response.html_element
+    body_child_html = process_block_response.html_element.html
 
     database: Database = client.databases.retrieve(database_id=database_id)  # type: ignore
     if database.title and database.title[0]:
         head = Head([], Title([], database.title[0].plain_text))
 
-    pages_or_databases: List[Union[Page, Database]] = []
-    for page_chunk in client.databases.iterate_query(database_id=database_id):  # type: ignore
-        pages_or_databases.extend(page_chunk)
-
+    # Build the rows of each chunk of query results while the next chunk is being fetched
+    property_keys = get_table_property_keys(properties=database.properties)
+    table_body_rows: List[Tr] = []
     child_pages: List[str] = []
     child_databases: List[str] = []
-    for page in pages_or_databases:
-        if isinstance(page, Database):
-            child_databases.append(page.id)
-        if isinstance(page, Page):
-            child_pages.append(page.id)
-
-    table_html = get_table_html(
-        pages_or_databases=pages_or_databases,
-        properties=database.properties,
-        logger=logger,
+    for page_chunk in prefetch(
+        client.databases.iterate_query(database_id=database_id),  # type: ignore
+    ):
+        for page in page_chunk:
+            if isinstance(page, Database):
+                child_databases.append(page.id)
+            if isinstance(page, Page):
+                child_pages.append(page.id)
+        table_body_rows.extend(
+            get_table_rows_html(
+                pages_or_databases=page_chunk,
+                property_keys=property_keys,
+                logger=logger,
+            ),
+        )
+
+    table_html = build_table_from_rows(
+        property_keys=property_keys,
+        table_body_rows=table_body_rows,
     )
     body_elements: List[HtmlTag] = [body_child_html, table_html]
     if database.title and database.title[0]:
@@ -305,7 +474,7 @@ def extract_database_html(
     )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChildExtractionResponse:
     child_pages: List[str] = field(default_factory=list)
     child_databases: List[str] = field(default_factory=list)
@@ -316,175 +485,182 @@ class QueueEntryType(enum.Enum):
     PAGE = "page"
 
 
-@dataclass
-class QueueEntry:
+class QueueEntry(NamedTuple):
     type: QueueEntryType
-    id: UUID
+    # Kept in the canonical string form the api returns, as that is how ids are compared and
+    # passed back to the api
+    id: str
 
 
-def get_recursive_content_from_page(
+def get_recursive_content_from_roots(
     client: Client,
-    page_id: str,
+    page_ids: List[str],
+    database_ids: List[str],
     logger: logging.Logger,
 ) -> ChildExtractionResponse:
+    # All roots are crawled together so the concurrent batches can mix entries from each of them,
+    # their ids are already canonical as the connector config normalizes them
     return get_recursive_content(
         client=client,
-        init_entry=QueueEntry(type=QueueEntryType.PAGE, id=UUID(page_id)),
+        init_entries=[QueueEntry(type=QueueEntryType.PAGE, id=i) for i in page_ids]
+        + [QueueEntry(type=QueueEntryType.DATABASE, id=i) for i in database_ids],
         logger=logger,
     )
 
 
-def get_recursive_content_from_database(
+def get_queue_entry_content(
     client: Client,
-    database_id: str,
-    logger: logging.Logger,
-) -> ChildExtractionResponse:
-    return get_recursive_content(
-        client=client,
-        init_entry=QueueEntry(type=QueueEntryType.DATABASE, id=UUID(database_id)),
-        logger=logger,
-    )
+    entry: QueueEntry,
+) -> Union[List[Block], List[Union[Page, Database]], APIResponseError]:
+    try:
+        if entry.type == QueueEntryType.PAGE:
+            return list_children(client=client, block_id=entry.id)
+        database_pages: List[Union[Page, Database]] = []
+        for page_entries in client.databases.iterate_query(  # type: ignore
+            database_id=entry.id,
+        ):
+            database_pages.extend(page_entries)
+        return database_pages
+    except APIResponseError as api_error:
+        return api_error
+
+
+def get_queue_entries_content(
+    client: Client,
+    entries: List[QueueEntry],
+) -> List[Union[List[Block], List[Union[Page, Database]], APIResponseError]]:
+    if len(entries) <= 1:
+        return [get_queue_entry_content(client=client, entry=entry) for entry in entries]
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(entries))) as executor:
+        return list(
+            executor.map(
+                lambda entry: get_queue_entry_content(client=client, entry=entry),
+                entries,
+            ),
+        )
 
 
 def get_recursive_content(
     client: Client,
-    init_entry: QueueEntry,
+    init_entries: List[QueueEntry],
     logger: logging.Logger,
 ) -> ChildExtractionResponse:
-    parents: List[QueueEntry] = [init_entry]
-    child_pages: List[str] = []
-    child_dbs: List[str] = []
-    processed: List[str] = []
-    while len(parents) > 0:
-        parent: QueueEntry = parents.pop()
-        processed.append(str(parent.id))
-        if parent.type == QueueEntryType.PAGE:
-            logger.debug(f"getting child data from page: {parent.id}")
-            page_children = []
-            try:
-                for children_block in client.blocks.children.iterate_list(  # type: ignore
-                    block_id=str(parent.id),
-                ):
-                    page_children.extend(children_block)
-            except APIResponseError as api_error:
-                logger.error(f"failed to get page with id {parent.id}: {api_error}")
-                if str(parent.id) in child_pages:
-                    child_pages.remove(str(parent.id))
-                continue
-            if not page_children:
-                continue
-
-            # Extract child pages
-            child_pages_from_page = [c for c in page_children if isinstance(c.block, notion_blocks.ChildPage)]
-            if child_pages_from_page:
-                child_page_blocks: List[notion_blocks.ChildPage] = [
-                    p.block for p in child_pages_from_page if isinstance(p.block, notion_blocks.ChildPage)
-                ]
-                logger.debug(
-                    "found child pages from parent page {}: {}".format(
-                        parent.id,
-                        ", ".join([block.title for block in child_page_blocks]),
-                    ),
-                )
-            new_pages = [p.id for p in child_pages_from_page if p.id not in processed]
-            new_pages = list(set(new_pages))
-            child_pages.extend(new_pages)
-            parents.extend(
-                [QueueEntry(type=QueueEntryType.PAGE, id=UUID(i)) for i in new_pages],
-            )
+    parents: Deque[QueueEntry] = deque(init_entries)
+    child_pages: Set[str] = set()
+    child_dbs: Set[str] = set()
+    # Ids are marked as seen when they are queued, so each one is only ever queued once
+    seen: Set[str] = {entry.id for entry in init_entries}
+
+    def enqueue(ids: List[str], entry_type: QueueEntryType, found: Set[str]):
+        for i in ids:
+            if i not in seen:
+                seen.add(i)
+                found.add(i)
+                parents.append(QueueEntry(type=entry_type, id=i))
 
-            # Extract child databases
-            child_dbs_from_page = [c for c in page_children if isinstance(c.block, notion_blocks.ChildDatabase)]
-            if child_dbs_from_page:
-                child_db_blocks: List[notion_blocks.ChildDatabase] = [
-                    c.block for c in page_children if isinstance(c.block, notion_blocks.ChildDatabase)
-                ]
-                logger.debug(
-                    "found child database from parent page {}: {}".format(
-                        parent.id,
-                        ", ".join([block.title for block in child_db_blocks]),
-                    ),
-                )
-            new_dbs = [db.id for db in child_dbs_from_page if db.id not in processed]
-            new_dbs = list(set(new_dbs))
-            child_dbs.extend(new_dbs)
-            parents.extend(
-                [QueueEntry(type=QueueEntryType.DATABASE, id=UUID(i)) for i in new_dbs],
-            )
-
-            linked_to_others: List[notion_blocks.LinkToPage] = [c.block for c in page_children if isinstance(c.block, notion_blocks.LinkToPage)]
-            for link in linked_to_others:
-                if (page_id := link.page_id) and (page_id not in processed and page_id not in child_pages):
-                    child_pages.append(page_id)
-                    parents.append(QueueEntry(type=QueueEntryType.PAGE, id=UUID(page_id)))
-                if (database_id := link.database_id) and (database_id not in processed and database_id not in child_dbs):
-                    child_dbs.append(database_id)
-                    parents.append(
-                        QueueEntry(type=QueueEntryType.DATABASE, id=UUID(database_id)),
+    while len(parents) > 0:
+        # Pull a batch of pending entries off the queue and fetch their content concurrently
+        batch: List[QueueEntry] = [
+            parents.popleft() for _ in range(min(len(parents), MAX_CONCURRENT_REQUESTS))
+        ]
+        for parent, content in zip(batch, get_queue_entries_content(client=client, entries=batch)):
+            if parent.type == QueueEntryType.PAGE:
+                logger.debug(f"getting child data from page: {parent.id}")
+                page_children = content
+                if isinstance(page_children, APIResponseError):
+                    logger.error(f"failed to get page with id {parent.id}: {page_children}")
+                    child_pages.discard(parent.id)
+                    continue
+                if not page_children:
+                    continue
+
+                # Bucket the children by block type in a single pass
+                page_buckets: Dict[type, List[Block]] = defaultdict(list)
+                for c in page_children:
+                    page_buckets[type(c.block)].append(c)
+
+                # Extract child pages
+                child_pages_from_page = page_buckets[notion_blocks.ChildPage]
+                if child_pages_from_page:
+                    logger.debug(
+                        "found child pages from parent page {}: {}".format(
+                            parent.id,
+                            ", ".join([c.block.title for c in child_pages_from_page]),
+                        ),
                     )
-
-        elif parent.type == QueueEntryType.DATABASE:
-            logger.debug(f"getting child data from database: {parent.id}")
-            database_pages: List[Union[Page, Database]] = []
-            try:
-                for page_entries in client.databases.iterate_query(  # type: ignore
-                    database_id=str(parent.id),
-                ):
-                    database_pages.extend(page_entries)
-            except APIResponseError as api_error:
-                logger.error(f"failed to get database with id {parent.id}: {api_error}")
-                if str(parent.id) in child_dbs:
-                    child_dbs.remove(str(parent.id))
-                continue
-            if not database_pages:
-                continue
-
-            child_pages_from_db = [p for p in database_pages if isinstance(p, Page)]
-            if child_pages_from_db:
-                logger.debug(
-                    "found child pages from parent database {}: {}".format(
-                        parent.id,
-                        ", ".join([p.url for p in child_pages_from_db]),
-                    ),
-                )
-            new_pages = [p.id for p in child_pages_from_db if p.id not in processed]
-            child_pages.extend(new_pages)
-            parents.extend(
-                [QueueEntry(type=QueueEntryType.PAGE, id=UUID(i)) for i in new_pages],
-            )
-
-            child_dbs_from_db = [p for p in database_pages if isinstance(p, Database)]
-            if child_dbs_from_db:
-                logger.debug(
-                    "found child database from parent database {}: {}".format(
-                        parent.id,
-                        ", ".join([db.url for db in child_dbs_from_db]),
-                    ),
-                )
-            new_dbs = [db.id for db in child_dbs_from_db if db.id not in processed]
-            child_dbs.extend(new_dbs)
-            parents.extend(
-                [QueueEntry(type=QueueEntryType.DATABASE, id=UUID(i)) for i in new_dbs],
-            )
+                enqueue([p.id for p in child_pages_from_page], QueueEntryType.PAGE, child_pages)
+
+                # Extract child databases
+                child_dbs_from_page = page_buckets[notion_blocks.ChildDatabase]
+                if child_dbs_from_page:
+                    logger.debug(
+                        "found child database from parent page {}: {}".format(
+                            parent.id,
+                            ", ".join([c.block.title for c in child_dbs_from_page]),
+                        ),
+                    )
+                enqueue([db.id for db in child_dbs_from_page], QueueEntryType.DATABASE, child_dbs)
+
+                for c in page_buckets[notion_blocks.LinkToPage]:
+                    link = c.block
+                    if page_id := link.page_id:
+                        enqueue([page_id], QueueEntryType.PAGE, child_pages)
+                    if database_id := link.database_id:
+                        enqueue([database_id], QueueEntryType.DATABASE, child_dbs)
+
+            elif parent.type == QueueEntryType.DATABASE:
+                logger.debug(f"getting child data from database: {parent.id}")
+                database_pages = content
+                if isinstance(database_pages, APIResponseError):
+                    logger.error(f"failed to get database with id {parent.id}: {database_pages}")
+                    child_dbs.discard(parent.id)
+                    continue
+                if not database_pages:
+                    continue
+
+                db_buckets: Dict[type, List[Union[Page, Database]]] = defaultdict(list)
+                for p in database_pages:
+                    db_buckets[type(p)].append(p)
+
+                child_pages_from_db = db_buckets[Page]
+                if child_pages_from_db:
+                    logger.debug(
+                        "found child pages from parent database {}: {}".format(
+                            parent.id,
+                            ", ".join([p.url for p in child_pages_from_db]),
+                        ),
+                    )
+                enqueue([p.id for p in child_pages_from_db], QueueEntryType.PAGE, child_pages)
+
+                child_dbs_from_db = db_buckets[Database]
+                if child_dbs_from_db:
+                    logger.debug(
+                        "found child database from parent database {}: {}".format(
+                            parent.id,
+                            ", ".join([db.url for db in child_dbs_from_db]),
+                        ),
+                    )
+                enqueue([db.id for db in child_dbs_from_db], QueueEntryType.DATABASE, child_dbs)
 
     return ChildExtractionResponse(
-        child_pages=child_pages,
-        child_databases=child_dbs,
+        child_pages=list(child_pages),
+        child_databases=list(child_dbs),
     )
 
 
+UUID_PATTERN = re.compile(
+    r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$",
+)
+
+
 def is_valid_uuid(uuid_str: str) -> bool:
-    try:
-        UUID(uuid_str)
-        return True
-    except Exception:
-        return False
+    return UUID_PATTERN.match(uuid_str) is not None
 
 
 def get_uuid_from_url(path: str) -> Optional[str]:
-    strings = path.split("-")
-    if len(strings) > 0 and is_valid_uuid(strings[-1]):
-        return strings[-1]
+    _, _, last = path.rpartition("-")
+    if is_valid_uuid(last):
+        return last
     return None
 
 
@@ -512,7 +688,7 @@ def is_database_url(client: Client, url: str):
     return check_resp == 200
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BuildTableResponse:
     table_html: HtmlTag
     child_pages: List[str] = field(default_factory=list)
@@ -522,18 +698,18 @@ class BuildTableResponse:
 def build_table(client: Client, table: Block) -> BuildTableResponse:
     if not isinstance(table.block, notion_blocks.Table):
         raise ValueError(f"block type not table: {type(table.block)}")
-    rows: List[notion_blocks.TableRow] = []
+    return build_table_response(table=table, rows=list_children(client=client, block_id=table.id))
+
+
+def build_table_response(table: Block, rows: List[Block]) -> BuildTableResponse:
     child_pages: List[str] = []
     child_databases: List[str] = []
-    for row_chunk in client.blocks.children.iterate_list(  # type: ignore
-        block_id=table.id,
-    ):
-        rows.extend(
-            [row.block for row in row_chunk if isinstance(row.block, notion_blocks.TableRow)],
-        )
+    table_rows: List[notion_blocks.TableRow] = [
+        row.block for row in rows if isinstance(row.block, notion_blocks.TableRow)
+    ]
 
     # Extract child databases and pages
-    for row in rows:
+    for row in table_rows:
         for c in row.cells:
             for rt in c.rich_texts:
                 if mention := rt.mention:
@@ -543,13 +719,13 @@ def build_table(client: Client, table: Block) -> BuildTableResponse:
                         child_databases.append(database.id)
 
     header: Optional[notion_blocks.TableRow] = None
-    if table.block.has_column_header:
-        header = rows.pop(0)
-    table_html_rows = []
+    if table.block.has_column_header:  # type: ignore
+        header = table_rows.pop(0)
     if header:
         header.is_header = True
-        table_html_rows.append(header.get_html())
-    table_html_rows.extend([row.get_html() for row in rows])
+    table_html_rows = ([header.get_html()] if header else []) + [
+        row.get_html() for row in table_rows
+    ]
     html_table = Table([], table_html_rows)
 
     return BuildTableResponse(
@@ -559,7 +735,7 @@ def build_table(client: Client, table: Block) -> BuildTableResponse:
     )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BuildColumnedListResponse:
     columned_list_html: HtmlTag
     child_pages: List[str] = field(default_factory=list)
@@ -569,29 +745,37 @@ class BuildColumnedListResponse:
 def build_columned_list(client: Client, logger: logging.Logger, column_parent: Block, level: int = 0) -> BuildColumnedListResponse:
     if not isinstance(column_parent.block, notion_blocks.ColumnList):
         raise ValueError(f"block type not column list: {type(column_parent.block)}")
-    columns: List[Block] = []
+    root = build_block_tree(
+        client=client,
+        logger=logger,
+        root=BlockNode(type=BlockNodeType.COLUMN_LIST, block=column_parent, level=level),
+    )
+    return root.response  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def get_column_style(num_columns: int) -> Style:
+    return Style(f"width:{100/num_columns}%; float: left")
+
+
+def build_columned_list_response(
+    column_parent: Block,
+    columns: List[ProcessBlockResponse],
+) -> BuildColumnedListResponse:
     child_pages: List[str] = []
     child_databases: List[str] = []
-    for column_chunk in client.blocks.children.iterate_list(  # type: ignore
-        block_id=column_parent.id,
-    ):
-        columns.extend(column_chunk)
-    num_columns = len(columns)
     columns_content = []
-    for column in columns:
-        column_content_response = process_block(
-            client=client,
-            logger=logger,
-            parent_block=column,
-            start_level=level + 1,
-        )
-        _, column_content_html = column_content_response.html_element
-        columns_content.append(
-            Div(
-                [Style(f"width:{100/num_columns}%; float: left")],
-                [column_content_html],
-            ),
-        )
+    # A column list can come back without any columns, there is no width to compute then
+    if columns:
+        column_style = get_column_style(num_columns=len(columns))
+        for column_content_response in columns:
+            column_content_html = column_content_response.html_element.html
+            columns_content.append(
+                Div(
+                    [column_style],
+                    [column_content_html],
+                ),
+            )
 
     return BuildColumnedListResponse(
         columned_list_html=Div([], columns_content),
@@ -600,25 +784,28 @@ def build_columned_list(client: Client, logger: logging.Logger, column_parent: B
     )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BulletedListResponse:
     html: HtmlTag
 
 
+# Attributes are never modified once created, so one instance is shared by every list item
+list_item_style = Style("margin-left: 10px")
+
 bulleted_list_styles = ["circle", "square", "disc"]
 
 
 def build_bulleted_list_item(
     html: HtmlTag,
 ) -> BulletedListResponse:
-    html.attributes = [Style("margin-left: 10px")]
+    html.attributes = [list_item_style]
 
     return BulletedListResponse(
         html=html,
     )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NumberedListResponse:
     html: HtmlTag
 
@@ -629,7 +816,7 @@ numbered_list_types = ["i", "a", "1"]
 def build_numbered_list_item(
     html: HtmlTag,
 ) -> NumberedListResponse:
-    html.attributes = [Style("margin-left: 10px")]
+    html.attributes = [list_item_style]
 
     return NumberedListResponse(
         html=html,
@@ -0,0 +1,84 @@
+import io
+from typing import Iterable, List, Optional, TextIO, Union
+
+from htmlBuilder.attributes import HtmlTagAttribute
+from htmlBuilder.tags import HtmlTag, SelfClosingHtmlTag, Text
+
+
+class HtmlWriter:
+    """Serializes html into a text stream in a single pass.
+
+    The output is identical to htmlBuilder's HtmlTag.render, which instead renders every
+    subtree to its own string and joins them again at each level above it.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, pretty: bool = False):
+        self.stream = stream if stream is not None else io.StringIO()
+        self.pretty = pretty
+        self._open_tags: List[str] = []
+        # The closing '>' of the last opened tag is held back until it is known whether the
+        # tag has any inner html, as that decides where pretty output places line breaks
+        self._start_tag_pending = False
+
+    @property
+    def _separator(self) -> str:
+        return "\n" if self.pretty else ""
+
+    @property
+    def _indentation(self) -> str:
+        return "  " * len(self._open_tags) if self.pretty else ""
+
+    def _finish_start_tag(self):
+        if self._start_tag_pending:
+            self.stream.write(f">{self._separator}")
+            self._start_tag_pending = False
+
+    def _write_start_tag(self, name: str, attributes: Iterable[HtmlTagAttribute]):
+        self._finish_start_tag()
+        self.stream.write(f"{self._indentation}<{name}")
+        for attribute in attributes:
+            self.stream.write(f" {attribute.name}='{str(attribute.value)}'")
+
+    def open_tag(self, name: str, attributes: Iterable[HtmlTagAttribute] = ()):
+        self._write_start_tag(name=name, attributes=attributes)
+        self._open_tags.append(name)
+        self._start_tag_pending = True
+
+    def close_tag(self):
+        name = self._open_tags.pop()
+        if self._start_tag_pending:
+            self.stream.write(f"></{name}>{self._separator}")
+            self._start_tag_pending = False
+        else:
+            self.stream.write(f"{self._indentation}</{name}>{self._separator}")
+
+    def self_closing_tag(self, name: str, attributes: Iterable[HtmlTagAttribute] = ()):
+        self._write_start_tag(name=name, attributes=attributes)
+        self.stream.write(f"/>{self._separator}")
+
+    def text(self, text: str):
+        self._finish_start_tag()
+        self.stream.write(f"{self._indentation}{text}{self._separator}")
+
+    def write(self, html: Union[HtmlTag, Text, str]) -> "HtmlWriter":
+        # Walk the tree with an explicit stack rather than recursing, None marks the point
+        # where all of a tag's inner html has been written
+        stack: List[Union[HtmlTag, Text, str, None]] = [html]
+        while stack:
+            item = stack.pop()
+            if item is None:
+                self.close_tag()
+            elif isinstance(item, SelfClosingHtmlTag):
+                self.self_closing_tag(name=item.name, attributes=item.attributes)
+            elif isinstance(item, HtmlTag):
+                self.open_tag(name=item.name, attributes=item.attributes)
+                stack.append(None)
+                stack.extend(reversed(item.inner_html))
+            elif isinstance(item, Text):
+                self.text(item.text)
+            else:
+                self.text(item)
+        return self
+
+    def getvalue(self) -> str:
+        return self.stream.getvalue()  # type: ignore
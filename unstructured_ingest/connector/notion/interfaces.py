@@ -1,10 +1,17 @@
+import sys
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, ClassVar, Dict, Optional
 
 from htmlBuilder.tags import HtmlTag
 
+# Slotted dataclasses are only available from python 3.10, older versions fall back to
+# regular dataclasses
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class FromJSONMixin(ABC):
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_dict(cls, data: dict):
@@ -12,21 +19,22 @@ class FromJSONMixin(ABC):
 
 
 class GetHTMLMixin(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_html(self) -> Optional[HtmlTag]:
         pass
 
 
 class BlockBase(FromJSONMixin, GetHTMLMixin):
-    @staticmethod
-    @abstractmethod
-    def can_have_children() -> bool:
-        pass
+    __slots__ = ()
+
+    can_have_children: ClassVar[bool]
 
 
 class DBPropertyBase(FromJSONMixin):
-    pass
+    __slots__ = ()
 
 
 class DBCellBase(FromJSONMixin, GetHTMLMixin):
-    pass
+    __slots__ = ()
@@ -1,6 +1,8 @@
 # https://developers.notion.com/reference/page
+import inspect
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Type
 
 from htmlBuilder.tags import HtmlTag
 
@@ -49,6 +51,13 @@ block_type_mapping = {
 }
 
 
+@lru_cache(maxsize=None)
+def from_dict_accepts_client(block_type: Type[BlockBase]) -> bool:
+    # Inspecting the signature is costly compared to building a block, so it's only done once
+    # per block type
+    return "client" in inspect.signature(block_type.from_dict).parameters
+
+
 @dataclass
 class Block(FromJSONMixin, GetHTMLMixin):
     id: str
@@ -76,13 +85,11 @@ class Block(FromJSONMixin, GetHTMLMixin):
         last_edited_by = data.pop("last_edited_by")
         parent = data.pop("parent")
         try:
-            import inspect
-            from_dict_func = block_type_mapping[t].from_dict
-            params = inspect.signature(from_dict_func).parameters
-            if 'client' in params:
-                block_arg = from_dict_func(block_data, client=client)  # type: ignore
+            block_type = block_type_mapping[t]
+            if from_dict_accepts_client(block_type):
+                block_arg = block_type.from_dict(block_data, client=client)  # type: ignore
             else:
-                block_arg = from_dict_func(block_data)  # type: ignore
+                block_arg = block_type.from_dict(block_data)  # type: ignore
             block = cls(
                 created_by=PartialUser.from_dict(created_by),
                 last_edited_by=PartialUser.from_dict(last_edited_by),
@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#bookmark
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from htmlBuilder.attributes import Href
 from htmlBuilder.tags import A, Br, Div, HtmlTag
@@ -14,6 +14,8 @@ class Bookmark(BlockBase):
     url: str
     caption: List[RichText] = field(default_factory=list)
 
+    can_have_children: ClassVar[bool] = False
+
     @classmethod
     def from_dict(cls, data: dict):
         captions = data.pop("caption", [])
@@ -34,7 +36,3 @@ class Bookmark(BlockBase):
         joined[0::2] = texts
 
         return Div([], joined)
-
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#breadcrumb
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from htmlBuilder.tags import HtmlTag
 
@@ -9,9 +9,7 @@ from unstructured_ingest.connector.notion.interfaces import BlockBase
 
 @dataclass
 class Breadcrumb(BlockBase):
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
+    can_have_children: ClassVar[bool] = False
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#callout
 from dataclasses import dataclass, field
-from typing import List, Optional, Union
+from typing import ClassVar, List, Optional, Union
 
 from htmlBuilder.attributes import Href, Style
 from htmlBuilder.tags import A, Div, HtmlTag, P
@@ -69,9 +69,7 @@ class Callout(BlockBase):
     icon: Optional[Union[EmojiIcon, ExternalIcon]] = None
     rich_text: List[RichText] = field(default_factory=list)
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#child-database
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from htmlBuilder.tags import HtmlTag, P
 
@@ -11,9 +11,7 @@ from unstructured_ingest.connector.notion.interfaces import BlockBase
 class ChildDatabase(BlockBase):
     title: str
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
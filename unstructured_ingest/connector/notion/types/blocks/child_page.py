@@ -1,23 +1,27 @@
 # https://developers.notion.com/reference/block#child-page
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from htmlBuilder.tags import HtmlTag, P
 
-from unstructured_ingest.connector.notion.interfaces import BlockBase, GetHTMLMixin
+from unstructured_ingest.connector.notion.interfaces import (
+    DATACLASS_SLOTS,
+    BlockBase,
+    GetHTMLMixin,
+)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChildPage(BlockBase, GetHTMLMixin):
     title: str
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
-        return cls(**data)
+        # Titles such as "Untitled" repeat across large workspaces, interning shares one string
+        return cls(title=sys.intern(data.pop("title")), **data)
 
     def get_html(self) -> Optional[HtmlTag]:
         return P([], self.title)
@@ -1,7 +1,7 @@
 # https://developers.notion.com/reference/block#code
 from dataclasses import dataclass, field
 import html
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from htmlBuilder.tags import Br, Div, HtmlTag
 from htmlBuilder.tags import Code as HtmlCode
@@ -16,9 +16,7 @@ class Code(BlockBase):
     rich_text: List[RichText] = field(default_factory=list)
     caption: List[RichText] = field(default_factory=list)
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
+    can_have_children: ClassVar[bool] = False
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#column-list-and-column
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from htmlBuilder.tags import HtmlTag
 
@@ -9,9 +9,7 @@ from unstructured_ingest.connector.notion.interfaces import BlockBase
 
 @dataclass
 class ColumnList(BlockBase):
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -23,9 +21,7 @@ class ColumnList(BlockBase):
 
 @dataclass
 class Column(BlockBase):
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
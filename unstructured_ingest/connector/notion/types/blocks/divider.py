@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#divider
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from htmlBuilder.attributes import Style
 from htmlBuilder.tags import Hr, HtmlTag
@@ -10,9 +10,7 @@ from unstructured_ingest.connector.notion.interfaces import BlockBase
 
 @dataclass
 class Divider(BlockBase):
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
+    can_have_children: ClassVar[bool] = False
 
     @classmethod
     def from_dict(cls, data: dict):
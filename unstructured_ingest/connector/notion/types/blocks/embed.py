@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#embed
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from htmlBuilder.attributes import Href
 from htmlBuilder.tags import A, Br, Div, HtmlTag
@@ -14,9 +14,7 @@ class Embed(BlockBase):
     url: str
     caption: List[RichText] = field(default_factory=list)
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
+    can_have_children: ClassVar[bool] = False
 
     @classmethod
     def from_dict(cls, data: dict):
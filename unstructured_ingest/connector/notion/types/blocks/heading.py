@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#headings
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from htmlBuilder.attributes import Style
 from htmlBuilder.tags import Div, HtmlTag
@@ -15,9 +15,7 @@ class Heading(BlockBase):
     is_toggleable: bool
     rich_text: List[RichText] = field(default_factory=list)
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
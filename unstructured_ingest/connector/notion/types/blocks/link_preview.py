@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#link-preview
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from htmlBuilder.attributes import Href
 from htmlBuilder.tags import A, HtmlTag
@@ -12,9 +12,7 @@ from unstructured_ingest.connector.notion.interfaces import BlockBase
 class LinkPreview(BlockBase):
     url: str
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
+    can_have_children: ClassVar[bool] = False
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#link-to-page
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from htmlBuilder.tags import Div, HtmlTag
 
@@ -13,9 +13,7 @@ class LinkToPage(BlockBase):
     page_id: Optional[str] = None
     database_id: Optional[str] = None
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
+    can_have_children: ClassVar[bool] = False
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#paragraph
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from htmlBuilder.tags import Br, Div, HtmlTag
 
@@ -14,9 +14,7 @@ class Paragraph(BlockBase):
     children: List[dict] = field(default_factory=list)
     rich_text: List[RichText] = field(default_factory=list)
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
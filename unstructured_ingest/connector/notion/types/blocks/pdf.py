@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#pdf
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from htmlBuilder.attributes import Href
 from htmlBuilder.tags import A, Br, Div, HtmlTag
@@ -17,9 +17,7 @@ class PDF(BlockBase):
     external: Optional[External] = None
     file: Optional[File] = None
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
+    can_have_children: ClassVar[bool] = False
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#synced-block
 from dataclasses import dataclass, field
-from typing import Optional, Literal
+from typing import ClassVar, Literal, Optional
 
 from htmlBuilder.tags import HtmlTag
 
@@ -11,9 +11,7 @@ from unstructured_ingest.connector.notion.interfaces import BlockBase
 class OriginalSyncedBlock(BlockBase):
     synced_from: None = field(default=None)
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -28,9 +26,7 @@ class DuplicateSyncedBlock(BlockBase):
     block_id: str
     type: Literal["block_id"] = "block_id"
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -41,9 +37,7 @@ class DuplicateSyncedBlock(BlockBase):
 
 
 class SyncBlock(BlockBase):
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#table
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from htmlBuilder.tags import HtmlTag, Td, Th, Thead, Tr
 
@@ -17,9 +17,7 @@ class Table(BlockBase):
     has_column_header: bool
     has_row_header: bool
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -50,15 +48,13 @@ class TableRow(BlockBase):
     is_header: bool = False
     cells: List[TableCell] = field(default_factory=list)
 
+    can_have_children: ClassVar[bool] = False
+
     @classmethod
     def from_dict(cls, data: dict, client=None):
         cells = data.get("cells", [])
         return cls(cells=[TableCell.from_dict({"rich_texts": c}, client=client) for c in cells])
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
-
     def get_html(self) -> Optional[HtmlTag]:
         if self.is_header:
             return Thead([], [Tr([], [cell.get_html(is_header=self.is_header) for cell in self.cells])])
@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#table-of-contents
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from htmlBuilder.tags import HtmlTag
 
@@ -11,9 +11,7 @@ from unstructured_ingest.connector.notion.interfaces import BlockBase
 class TableOfContents(BlockBase):
     color: str
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
+    can_have_children: ClassVar[bool] = False
 
     @classmethod
     def from_dict(cls, data: dict):
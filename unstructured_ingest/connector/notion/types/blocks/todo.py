@@ -1,6 +1,6 @@
 # https://developers.notion.com/reference/block#to-do
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from htmlBuilder.attributes import Checked, Style, Type
 from htmlBuilder.tags import Div, HtmlTag, Input
@@ -15,9 +15,7 @@ class ToDo(BlockBase):
     checked: bool = False
     rich_text: List[RichText] = field(default_factory=list)
 
-    @staticmethod
-    def can_have_children() -> bool:
-        return True
+    can_have_children: ClassVar[bool] = True
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from htmlBuilder.tags import HtmlTag
 
@@ -8,9 +8,7 @@ from unstructured_ingest.connector.notion.interfaces import BlockBase
 
 @dataclass
 class Unsupported(BlockBase):
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
+    can_have_children: ClassVar[bool] = False
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -1,5 +1,5 @@
 # https://developers.notion.com/reference/block#image
-from typing import Optional
+from typing import ClassVar, Optional
 
 from htmlBuilder.attributes import Src
 from htmlBuilder.tags import HtmlTag, Source
@@ -10,9 +10,7 @@ from unstructured_ingest.connector.notion.types.file import FileObject
 
 
 class Video(BlockBase, FileObject):
-    @staticmethod
-    def can_have_children() -> bool:
-        return False
+    can_have_children: ClassVar[bool] = False
 
     def get_html(self) -> Optional[HtmlTag]:
         if self.external:
@@ -5,7 +5,7 @@ from typing import Optional, Union
 from htmlBuilder.tags import HtmlTag
 
 from unstructured_ingest.connector.notion.interfaces import DBCellBase, DBPropertyBase
-from unstructured_ingest.connector.notion.types.user import PartialUser, People, Bots
+from unstructured_ingest.connector.notion.types.user import Bots, PartialUser, People, map_user
 
 
 @dataclass
@@ -32,14 +32,7 @@ class CreatedByCell(DBCellBase):
     def from_dict(cls, data: dict):
         created_by = data.pop("created_by", None)
         if created_by:
-            if created_by.get("type") == "person":
-                created_by=People.from_dict(created_by)
-            elif created_by.get("type") == "bot":
-                created_by=Bots.from_dict(created_by)
-            elif created_by.get("object") == "user":
-                created_by=PartialUser.from_dict(created_by)
-            else:
-                raise ValueError(f"Invalid created_by type {created_by.get('type')}")
+            created_by = map_user(created_by)
 
         return cls(created_by=created_by, **data)
         
@@ -5,7 +5,7 @@ from typing import Optional, Union
 from htmlBuilder.tags import HtmlTag
 
 from unstructured_ingest.connector.notion.interfaces import DBCellBase, DBPropertyBase
-from unstructured_ingest.connector.notion.types.user import PartialUser, People, Bots
+from unstructured_ingest.connector.notion.types.user import Bots, PartialUser, People, map_user
 
 
 @dataclass
@@ -30,14 +30,7 @@ class LastEditedByCell(DBCellBase):
     def from_dict(cls, data: dict):
         last_edited_by = data.pop("last_edited_by", None)
         if last_edited_by:
-            if last_edited_by.get("type") == "person":
-                last_edited_by=People.from_dict(last_edited_by)
-            elif last_edited_by.get("type") == "bot":
-                last_edited_by=Bots.from_dict(last_edited_by)
-            elif last_edited_by.get("object") == "user":
-                last_edited_by=PartialUser.from_dict(last_edited_by)
-            else:
-                raise ValueError(f"Invalid last_edited_by type {last_edited_by.get('type')}")
+            last_edited_by = map_user(last_edited_by)
 
         return cls(last_edited_by=last_edited_by, **data)
 
@@ -1,19 +1,19 @@
 # https://developers.notion.com/reference/property-object#relation
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 from urllib.parse import unquote
 
 from htmlBuilder.tags import Div, HtmlTag
 
 from unstructured_ingest.connector.notion.interfaces import (
+    DATACLASS_SLOTS,
     DBCellBase,
     DBPropertyBase,
     FromJSONMixin,
 )
 
 
-@dataclass
-class DualProperty(FromJSONMixin):
+class DualProperty(NamedTuple):
     synced_property_id: str
     synced_property_name: str
 
@@ -22,8 +22,7 @@ class DualProperty(FromJSONMixin):
         return cls(**data)
 
 
-@dataclass
-class SingleProperty(FromJSONMixin):
+class SingleProperty(NamedTuple):
     synced_property_id: Optional[str] = None
     synced_property_name: Optional[str] = None
 
@@ -31,7 +30,14 @@ class SingleProperty(FromJSONMixin):
     def from_dict(cls, data: dict):
         return cls(**data)
 
-@dataclass
+
+relation_property_type_mapping = {
+    "dual_property": DualProperty,
+    "single_property": SingleProperty,
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class RelationProp(FromJSONMixin):
     database_id: str
     type: str
@@ -41,18 +47,13 @@ class RelationProp(FromJSONMixin):
     @classmethod
     def from_dict(cls, data: dict):
         t = data.get("type")
-        if t == "dual_property":
-            dual_property = DualProperty.from_dict(data.pop(t))
-            return cls(dual_property=dual_property, **data)
-        elif t == "single_property":
-            single_property = SingleProperty.from_dict(data.pop(t))
-            return cls(single_property=single_property, **data)
-        else:
+        if not (property_type := relation_property_type_mapping.get(t)):  # type: ignore
             raise ValueError(f"{t} type not recognized")
+        return cls(**{t: property_type.from_dict(data.pop(t))}, **data)  # type: ignore
 
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Relation(DBPropertyBase):
     id: str
     name: str
@@ -65,7 +66,7 @@ class Relation(DBPropertyBase):
         return cls(relation=RelationProp.from_dict(data.pop("relation")), **data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RelationCell(DBCellBase):
     id: str
     has_more: bool
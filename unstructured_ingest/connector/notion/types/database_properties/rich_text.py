@@ -4,13 +4,17 @@ from typing import List, Optional
 
 from htmlBuilder.tags import Div, HtmlTag, Span
 
-from unstructured_ingest.connector.notion.interfaces import DBCellBase, DBPropertyBase
+from unstructured_ingest.connector.notion.interfaces import (
+    DATACLASS_SLOTS,
+    DBCellBase,
+    DBPropertyBase,
+)
 from unstructured_ingest.connector.notion.types.rich_text import (
     RichText as RichTextType,
 )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RichText(DBPropertyBase):
     id: str
     name: str
@@ -23,7 +27,7 @@ class RichText(DBPropertyBase):
         return cls(**data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RichTextCell(DBCellBase):
     id: str
     rich_text: List[RichTextType]
@@ -5,16 +5,17 @@ from typing import Optional, Union
 from htmlBuilder.tags import Div, HtmlTag, Span
 
 from unstructured_ingest.connector.notion.interfaces import (
+    DATACLASS_SLOTS,
     DBCellBase,
     DBPropertyBase,
     FromJSONMixin,
     GetHTMLMixin,
 )
 from unstructured_ingest.connector.notion.types.date import Date
-from unstructured_ingest.connector.notion.types.user import PartialUser, People, Bots
+from unstructured_ingest.connector.notion.types.user import Bots, PartialUser, People, map_user
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Verification(DBPropertyBase):
     id: str
     name: str
@@ -27,7 +28,7 @@ class Verification(DBPropertyBase):
         return cls(**data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class VerificationData(FromJSONMixin, GetHTMLMixin):
     state: Optional[str]
     verified_by: Optional[Union[People, Bots, PartialUser]]
@@ -38,17 +39,10 @@ class VerificationData(FromJSONMixin, GetHTMLMixin):
         date = data.pop("date", None)
         verified_by = data.pop("verified_by", None)
         if verified_by:
-            if verified_by.get("type") == "person":
-                last_everified_byited_by=People.from_dict(verified_by)
-            elif verified_by.get("type") == "bot":
-                verified_by=Bots.from_dict(verified_by)
-            elif verified_by.get("object") == "user":
-                verified_by=PartialUser.from_dict(verified_by)
-            else:
-                raise ValueError(f"Invalid verified_by type {verified_by.get('type')}")
-        
+            verified_by = map_user(verified_by)
+
         return cls(
-            verified_by=verified_by if verified_by else None,
+            verified_by=verified_by or None,
             date=Date.from_dict(data=date) if date else None,
             **data,
         )
@@ -66,7 +60,7 @@ class VerificationData(FromJSONMixin, GetHTMLMixin):
         return None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class VerificationCell(DBCellBase):
     id: str
     verification: Optional[VerificationData]
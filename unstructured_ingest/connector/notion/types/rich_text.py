@@ -7,6 +7,7 @@ from htmlBuilder.tags import A, B, Code, Div, HtmlTag, I, S, Span, U
 from htmlBuilder.tags import Text as HtmlText
 
 from unstructured_ingest.connector.notion.interfaces import (
+    DATACLASS_SLOTS,
     FromJSONMixin,
     GetHTMLMixin,
 )
@@ -14,7 +15,7 @@ from unstructured_ingest.connector.notion.types.date import Date
 from unstructured_ingest.connector.notion.types.user import People
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Annotations(FromJSONMixin):
     bold: bool
     code: bool
@@ -28,7 +29,7 @@ class Annotations(FromJSONMixin):
         return cls(**data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Equation(FromJSONMixin, GetHTMLMixin):
     expression: str
 
@@ -40,7 +41,7 @@ class Equation(FromJSONMixin, GetHTMLMixin):
         return Code([], self.expression) if self.expression else None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MentionDatabase(FromJSONMixin, GetHTMLMixin):
     id: str
 
@@ -52,7 +53,7 @@ class MentionDatabase(FromJSONMixin, GetHTMLMixin):
         return Div([], self.id) if self.id else None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MentionLinkPreview(FromJSONMixin, GetHTMLMixin):
     url: str
 
@@ -64,7 +65,7 @@ class MentionLinkPreview(FromJSONMixin, GetHTMLMixin):
         return A([Href(self.url)], self.url) if self.url else None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MentionPage(FromJSONMixin, GetHTMLMixin):
     id: str
 
@@ -76,7 +77,7 @@ class MentionPage(FromJSONMixin, GetHTMLMixin):
         return Div([], self.id) if self.id else None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MentionTemplate(FromJSONMixin):
     template_mention_date: Optional[str]
     template_mention_user: Optional[str]
@@ -86,7 +87,7 @@ class MentionTemplate(FromJSONMixin):
         return cls(**data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Mention(FromJSONMixin, GetHTMLMixin):
     type: str
     database: Optional[MentionDatabase] = None
@@ -130,7 +131,7 @@ class Mention(FromJSONMixin, GetHTMLMixin):
         return None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Text(FromJSONMixin):
     content: str
     link: Optional[dict]
@@ -140,7 +141,7 @@ class Text(FromJSONMixin):
         return cls(**data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RichText(FromJSONMixin, GetHTMLMixin):
     type: str
     plain_text: str
@@ -1,27 +1,32 @@
 # https://developers.notion.com/reference/user
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from html import escape
+from typing import Dict, NamedTuple, Optional, Union
 
 from htmlBuilder.attributes import Href
 from htmlBuilder.tags import A, Div, HtmlTag
 
-from unstructured_ingest.connector.notion.interfaces import FromJSONMixin, GetHTMLMixin
+from unstructured_ingest.connector.notion.interfaces import (
+    DATACLASS_SLOTS,
+    FromJSONMixin,
+    GetHTMLMixin,
+)
 
 
-@dataclass
-class PartialUser(FromJSONMixin, GetHTMLMixin):
+# Attached to every block, page and database, so kept as a lightweight named tuple
+class PartialUser(NamedTuple):
     id: str
     object: str = "user"
 
     @classmethod
     def from_dict(cls, data: dict):
         return cls(id=data["id"])
-    
+
     def get_html(self) -> Optional[HtmlTag]:
         return None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class User(FromJSONMixin, GetHTMLMixin):
     object: dict
     id: str
@@ -39,19 +44,21 @@ class User(FromJSONMixin, GetHTMLMixin):
             text = f"[{text}]({self.avatar_url}"
         return text
 
+    # htmlBuilder writes text and attribute values as is, user names and avatar urls are
+    # escaped so that quotes or angle brackets in them can't break the surrounding html
     def get_html(self) -> Optional[HtmlTag]:
         if self.avatar_url:
-            return A([Href(self.avatar_url)], self.name)
+            return A([Href(escape(self.avatar_url))], escape(self.name) if self.name else [])
         else:
-            return Div([], self.name or [])
+            return Div([], escape(self.name) if self.name else [])
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class People(User):
     person: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Bots(User):
     owner: Optional[Dict] = None
     workspace_name: Optional[str] = None
@@ -69,6 +76,20 @@ class Bots(User):
 
     def get_html(self) -> Optional[HtmlTag]:
         if self.avatar_url:
-            return A([Href(self.avatar_url)], self.name)
+            return A([Href(escape(self.avatar_url))], escape(self.name) if self.name else [])
         else:
-            return Div([], self.name)
+            return Div([], escape(self.name) if self.name else [])
+
+
+user_type_mapping = {
+    "person": People,
+    "bot": Bots,
+}
+
+
+def map_user(data: dict) -> Union[People, Bots, PartialUser]:
+    if user_type := user_type_mapping.get(data.get("type")):  # type: ignore
+        return user_type.from_dict(data)
+    if data.get("object") == "user":
+        return PartialUser.from_dict(data)
+    raise ValueError(f"Invalid user type {data.get('type')}")